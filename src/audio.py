@@ -7,8 +7,11 @@ Core DSP components for sound synthesis:
 - ADSR: Envelope generation for amplitude shaping
 """
 
+import math
 import numpy as np
 
+TWO_PI = 2 * math.pi
+
 class Oscillator:
     """Generates continuous waveforms with phase-correct frequency control"""
     
@@ -31,7 +34,7 @@ class Oscillator:
             np.ndarray: Generated audio samples
         """
         # Ensure phase continuity between buffer generations
-        self.phase = self.phase % (2 * np.pi)
+        self.phase = math.fmod(self.phase, TWO_PI)
         
         # Apply detune using semitone ratio
         detuned_frequency = frequency * (2 ** (detune / 12.0))
@@ -55,9 +58,9 @@ class Oscillator:
                 
                 harmonic = self._generate_base_waveform(harmonic_t, waveform)
                 output += harmonic * (harmonics / i)  # Decrease amplitude for higher harmonics
-                self.harmonics_phases[i-2] = harmonic_t[-1] % (2 * np.pi)
+                self.harmonics_phases[i-2] = math.fmod(harmonic_t[-1], TWO_PI)
         
-        self.phase = t[-1] % (2 * np.pi)
+        self.phase = math.fmod(t[-1], TWO_PI)
         return output / np.max(np.abs(output))  # Scale to have a maximum amplitude of 1
 
     def _generate_base_waveform(self, t, waveform):
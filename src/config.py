@@ -14,20 +14,72 @@ class AudioConfig:
     SAMPLE_RATE: int = 44100
     BUFFER_SIZE: int = 1024
     MAX_VOICES: int = 16
+    LATENCY: str = 'low'  # PortAudio latency hint when no device-specific value is given
 
 @dataclass
 class MIDIConfig:
     """MIDI control change mappings"""
-    OSC_MIX_CCS: Tuple[int, ...] = (14, 15, 16, 17, 18)  # Add 5th oscillator
+    OSC_MIX_CCS: Tuple[int, ...] = (14, 15, 16, 17, 24)  # 5th oscillator on CC 24; CC 18 is ADSR attack
     OSC_DETUNE_CCS: Tuple[int, ...] = (26, 27, 28, 29, 30)  # Add 5th oscillator
     FILTER_CUTOFF_CC: int = 22
     FILTER_RES_CC: int = 23
     ADSR_CCS: Tuple[int, ...] = (18, 19, 20, 21)
 
+# MIDI note number -> frequency in Hz (A4 = note 69 = 440 Hz), so voices skip the pow per block
+MIDI_FREQ = tuple(440.0 * 2.0 ** ((n - 69) / 12.0) for n in range(128))
+
+# Layout of ModuleState.params, the contiguous block of modulatable parameters
+NUM_OSCILLATORS = 5
+P_OSC_MIX = 0
+P_OSC_DETUNE = P_OSC_MIX + NUM_OSCILLATORS
+P_OSC_HARMONICS = P_OSC_DETUNE + NUM_OSCILLATORS
+P_FILTER_CUTOFF = P_OSC_HARMONICS + NUM_OSCILLATORS
+P_FILTER_RES = P_FILTER_CUTOFF + 1
+P_MASTER_GAIN = P_FILTER_RES + 1
+P_MASTER_PAN = P_MASTER_GAIN + 1
+NUM_PARAMS = P_MASTER_PAN + 1
+
+# Parameter name -> index into ModuleState.params
+PARAM_INDEX = {
+    **{f'osc_mix_{i}': P_OSC_MIX + i for i in range(NUM_OSCILLATORS)},
+    **{f'osc_detune_{i}': P_OSC_DETUNE + i for i in range(NUM_OSCILLATORS)},
+    **{f'osc_harmonics_{i}': P_OSC_HARMONICS + i for i in range(NUM_OSCILLATORS)},
+    'filter_cutoff': P_FILTER_CUTOFF,
+    'filter_res': P_FILTER_RES,
+    'master_gain': P_MASTER_GAIN,
+    'master_pan': P_MASTER_PAN
+}
+
+def _param_slice(start, count):
+    """Expose a run of params as an array view attribute"""
+    def fget(self):
+        return self.params[start:start + count]
+    def fset(self, value):
+        self.params[start:start + count] = value
+    return property(fget, fset)
+
+def _param_scalar(index):
+    """Expose a single entry of params as a float attribute"""
+    def fget(self):
+        return self.params[index]
+    def fset(self, value):
+        self.params[index] = value
+    return property(fget, fset)
+
 class ModuleState:
     """State management for synthesizer modules"""
     
+    # Modulatable parameters live in self.params; these keep the attribute API
+    osc_mix = _param_slice(P_OSC_MIX, NUM_OSCILLATORS)
+    osc_detune = _param_slice(P_OSC_DETUNE, NUM_OSCILLATORS)
+    osc_harmonics = _param_slice(P_OSC_HARMONICS, NUM_OSCILLATORS)
+    filter_cutoff = _param_scalar(P_FILTER_CUTOFF)
+    filter_res = _param_scalar(P_FILTER_RES)
+    master_gain = _param_scalar(P_MASTER_GAIN)
+    master_pan = _param_scalar(P_MASTER_PAN)
+    
     def __init__(self):
+        self.params = np.zeros(NUM_PARAMS, dtype=np.float32)
         self.osc_mix = np.ones(5) * 0.2  # Update to size 5
         self.osc_detune = np.zeros(5)  # Update to size 5
         self.osc_harmonics = np.zeros(5)  # Update to size 5
@@ -10,7 +10,7 @@ import sounddevice as sd
 from threading import Lock
 from audio import Oscillator, Filter, ADSR
 from noise_sub_module import NoiseSubModule
-from config import AUDIO_CONFIG, STATE
+from config import AUDIO_CONFIG, STATE, MIDI_FREQ
 from debug import DEBUG
 from lfo import LFO
 import tkinter as tk
@@ -72,7 +72,7 @@ class Voice:
 
         # Calculate frequency with possible LFO pitch modulation
         if self.note is not None:
-            base_freq = 440.0 * (2.0 ** ((self.note - 69) / 12.0))
+            base_freq = MIDI_FREQ[self.note]
             if 'pitch' in self.lfo.targets:
                 pitch_mod = lfo_values * 2  # +/- 2 semitones
                 frequency = base_freq * (2 ** (pitch_mod / 12))
@@ -156,13 +156,16 @@ class Voice:
 class Synthesizer:
     """Main synthesizer engine managing multiple voices and audio output"""
     
-    def __init__(self, device=None):
+    def __init__(self, device=None, latency=None):
         self.voices = [Voice() for _ in range(AUDIO_CONFIG.MAX_VOICES)]
         self.stream = None
         self.lock = Lock()
         self.device = device
+        self.latency = AUDIO_CONFIG.LATENCY if latency is None else latency  # Seconds, or 'low'/'high'
         self.samplerate = AUDIO_CONFIG.SAMPLE_RATE
         self.lfo = LFO()  # Initialize LFO
+        self._lfo_buf = np.empty(AUDIO_CONFIG.BUFFER_SIZE, dtype=np.float32)  # Reused LFO output block
+        self.midi = None  # MIDIHandler whose coalesced CCs are applied at each block boundary
         self.sequencer_active = False
         self.delay_buffer = np.zeros(44100)  # 1 second max delay
         self.delay_index = 0
@@ -194,6 +197,7 @@ class Synthesizer:
                 channels=1,
                 samplerate=self.samplerate,
                 blocksize=AUDIO_CONFIG.BUFFER_SIZE,
+                latency=self.latency,
                 dtype='float32',
                 callback=self._audio_callback
             )
@@ -221,9 +225,9 @@ class Synthesizer:
         """Restart the oscillator and spectrometer"""
         for voice in self.voices:
             voice.reset()
-        DEBUG.signal_monitors['audio_out'].buffer.clear()
-        DEBUG.signal_monitors['pre_filter'].buffer.clear()
-        DEBUG.signal_monitors['post_filter'].buffer.clear()
+        DEBUG.signal_monitors['audio_out'].clear()
+        DEBUG.signal_monitors['pre_filter'].clear()
+        DEBUG.signal_monitors['post_filter'].clear()
         print("Oscillator and spectrometer restarted.")
 
     def note_on(self, note: int, velocity: int):
@@ -254,8 +258,8 @@ class Synthesizer:
         if hasattr(self, 'gui'):
             self.gui._note_recorded()
 
-    def note_off(self, note: int):
-        """Handle MIDI note off event"""
+    def note_off(self, note: int, velocity: int = 0):
+        """Handle MIDI note off event (release velocity is accepted but not used)"""
         DEBUG.log(f"Processing Note Off: note={note}")
         
         with self.lock:
@@ -422,11 +426,18 @@ class Synthesizer:
 
         try:
             with self.lock:
-                # Process LFO first
-                self.lfo.generate(frames)
+                # Apply the latest value of each CC received since the last block
+                if self.midi is not None:
+                    self.midi.apply_pending()
                 
-                # Update modulation targets
-                self.lfo.process()  # Make sure all targets are updated
+                # Process LFO first; a bypassed LFO contributes nothing
+                if not self.lfo.bypassed:
+                    if len(self._lfo_buf) < frames:
+                        self._lfo_buf = np.empty(frames, dtype=np.float32)
+                    self.lfo.generate(frames, out=self._lfo_buf)
+                    
+                    # Update modulation targets
+                    self.lfo.process()  # Make sure all targets are updated
                 
                 output = np.zeros(frames)
                 active_count = 0
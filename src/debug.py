@@ -4,26 +4,48 @@ Debug and Monitoring System
 Provides real-time signal monitoring for debugging purposes.
 """
 
-from collections import deque
 import numpy as np
-from threading import Lock
 
 class SignalMonitor:
-    """Monitors and stores signal data for debugging"""
+    """Monitors and stores signal data for debugging
+    
+    Single-producer/single-consumer ring: the audio thread writes blocks and
+    then advances write_index, the GUI thread copies out the latest window.
+    No lock is taken on either side.
+    """
     
     def __init__(self, buffer_size: int = 1024):
-        self.buffer = deque(maxlen=buffer_size)
-        self.lock = Lock()
+        self.buffer_size = buffer_size
+        capacity = 1 << (2 * buffer_size - 1).bit_length()  # Power of two, at least 2x the window
+        self.mask = capacity - 1
+        self.buffer = np.zeros(capacity, dtype=np.float32)
+        self.write_index = 0  # Total samples written; only the audio thread advances it
         
     def update(self, values: np.ndarray):
         """Update the buffer with new signal values"""
-        with self.lock:
-            self.buffer.extend(values.flatten())
+        values = values.ravel()[-len(self.buffer):]
+        n = len(values)
+        start = self.write_index & self.mask
+        first = min(n, len(self.buffer) - start)
+        self.buffer[start:start + first] = values[:first]
+        self.buffer[:n - first] = values[first:]
+        self.write_index += n  # Publish only after the samples are in place
             
     def get_data(self) -> np.ndarray:
         """Retrieve the stored signal data"""
-        with self.lock:
-            return np.array(list(self.buffer)) if self.buffer else np.zeros(1024)
+        end = self.write_index
+        if end == 0:
+            return np.zeros(self.buffer_size, dtype=np.float32)
+        count = min(end, self.buffer_size)
+        start = (end - count) & self.mask
+        if start + count <= len(self.buffer):
+            return self.buffer[start:start + count].copy()
+        return np.concatenate((self.buffer[start:], self.buffer[:start + count - len(self.buffer)]))
+
+    def clear(self):
+        """Zero the ring and forget everything written so far"""
+        self.buffer.fill(0.0)
+        self.write_index = 0
 
 class DebugSystem:
     def __init__(self):
@@ -34,6 +56,8 @@ class DebugSystem:
             'lfo': SignalMonitor(),
             'adsr': SignalMonitor()
         }
+        self.verbose = False  # Extra startup detail such as full device listings
+        self.verbose_midi = False  # Log every MIDI message (off: keeps the MIDI thread quiet)
         
     def monitor_signal(self, name: str, values: np.ndarray):
         if name in self.signal_monitors:
@@ -42,7 +66,13 @@ class DebugSystem:
     def get_signal_data(self, name: str) -> np.ndarray:
         if name in self.signal_monitors:
             return self.signal_monitors[name].get_data()
-        return np.zeros(1024)
+        return np.zeros(1024, dtype=np.float32)
+
+    def get_signal_version(self, name: str) -> int:
+        """Samples written so far to a monitor; changes whenever new data arrives"""
+        if name in self.signal_monitors:
+            return self.signal_monitors[name].write_index
+        return 0
 
     def log(self, message: str):
         """Log a debug message"""
@@ -0,0 +1,105 @@
+"""
+Device Setup
+------------
+Audio output and MIDI input device discovery:
+- Cached device enumeration
+- JACK/ASIO output when available, else Realtek output with host API preference
+- MIDI input auto-selection
+"""
+
+import time
+import mido
+import sounddevice as sd
+from debug import DEBUG
+
+DEVICE_CACHE_TTL = 30.0  # Seconds a device enumeration stays valid
+_output_devices_cache = {'devices': None, 'ts': 0.0}
+_input_names_cache = {'names': None, 'ts': 0.0}
+
+def get_output_devices(refresh=False):
+    """Return sd.query_devices(), reusing a recent enumeration unless refresh is set"""
+    now = time.monotonic()
+    if refresh or _output_devices_cache['devices'] is None or now - _output_devices_cache['ts'] > DEVICE_CACHE_TTL:
+        _output_devices_cache['devices'] = sd.query_devices()
+        _output_devices_cache['ts'] = now
+    return _output_devices_cache['devices']
+
+def get_input_names(refresh=False):
+    """Return mido input port names, reusing a recent enumeration unless refresh is set"""
+    now = time.monotonic()
+    if refresh or _input_names_cache['names'] is None or now - _input_names_cache['ts'] > DEVICE_CACHE_TTL:
+        _input_names_cache['names'] = mido.get_input_names()
+        _input_names_cache['ts'] = now
+    return _input_names_cache['names']
+
+# Host API preference on Windows; lower-latency APIs score higher, others score -1
+HOSTAPI_PRIORITY = {
+    'Windows WASAPI': 3,
+    'Windows WDM-KS': 2,
+    'Windows DirectSound': 1,
+    'MME': 0
+}
+
+# Host APIs that bypass the OS mixer; their default output wins over any Realtek device
+PRO_AUDIO_HOSTAPIS = ('ASIO', 'JACK Audio Connection Kit')
+
+def find_pro_audio_device():
+    """Return the default output of the first available ASIO/JACK host API, or None"""
+    hostapis = sd.query_hostapis()
+    for name in PRO_AUDIO_HOSTAPIS:
+        for api in hostapis:
+            if api['name'] == name and api['default_output_device'] >= 0:
+                return api['default_output_device']
+    return None
+
+def select_output_device():
+    """Select the audio output: an ASIO/JACK default output if available, else the best Realtek device"""
+    pro_device = find_pro_audio_device()
+    if pro_device is not None:
+        DEBUG.log(f"\nUsing low-latency device: {get_output_devices()[pro_device]['name']}")
+        return pro_device
+    return force_realtek_device()
+
+def force_realtek_device():
+    """Force the use of a Realtek audio device if available, preferring low-latency host APIs"""
+    devices = get_output_devices()
+    hostapis = sd.query_hostapis()
+    if DEBUG.verbose:
+        # One write for the whole listing; per-line console output is slow on Windows
+        lines = ["\nAvailable Audio Output Devices:", "-" * 50]
+        lines.extend(f"{i}: {device['name']}" for i, device in enumerate(devices))
+        DEBUG.log("\n".join(lines))
+    
+    # Find the Realtek output with the best-scoring host API, stopping
+    # as soon as the top-priority API is found
+    top_score = max(HOSTAPI_PRIORITY.values())
+    realtek_device = None
+    best_score = None
+    for i, device in enumerate(devices):
+        if 'Realtek' in device['name'] and device['max_output_channels'] > 0:
+            score = HOSTAPI_PRIORITY.get(hostapis[device['hostapi']]['name'], -1)
+            if best_score is None or score > best_score:
+                realtek_device, best_score = i, score
+                if score == top_score:
+                    break
+    
+    if realtek_device is None:
+        DEBUG.log("No Realtek device found! Using default")
+        return sd.default.device[1]
+        
+    DEBUG.log(f"\nForcing Realtek device: {devices[realtek_device]['name']}")
+    return realtek_device
+
+def select_midi_device():
+    """Select MIDI input device"""
+    midi_devices = get_input_names()
+    DEBUG.log(f"\nFound MIDI devices: {midi_devices}")
+    
+    if not midi_devices:
+        DEBUG.log("No MIDI devices found!")
+        return None
+        
+    # Auto-select first device
+    selected_device = midi_devices[0]
+    DEBUG.log(f"Auto-selected MIDI device: {selected_device}")
+    return selected_device
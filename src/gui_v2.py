@@ -32,18 +32,43 @@ Features:
 import tkinter as tk
 from tkinter import ttk
 import numpy as np
-from threading import Thread, Lock
-import time
-from config import STATE, AUDIO_CONFIG
-import matplotlib.pyplot as plt
+from config import STATE, AUDIO_CONFIG, PARAM_INDEX
+import matplotlib.style
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import logging
+import math
+from functools import partial
+import time
 
 # Suppress Matplotlib debug messages
 logging.getLogger('matplotlib').setLevel(logging.WARNING)
 
+# Matplotlib's 'fast' style: aggressive path simplification and chunked Agg paths
+matplotlib.style.use('fast')
+
 from debug import DEBUG
-from lfo import LFO
+
+SPECTRUM_BINS = 256  # Log-spaced display bins between 20 Hz and 20 kHz
+SPECTRUM_FFT_SIZE = 1024  # Fixed power-of-two FFT length for the spectrum
+
+# Cutoff slider range (Hz) in log10 form, for normalizing to 0-1
+_CUTOFF_LOG_LO = math.log10(20)
+_CUTOFF_LOG_SPAN = math.log10(20000) - _CUTOFF_LOG_LO
+
+# Precomputed '#rrggbb' gray levels for the LFO LEDs
+_GRAY = tuple(f'#{i:02x}{i:02x}{i:02x}' for i in range(256))
+
+# LFO target combobox entry -> STATE.params name (see config.PARAM_INDEX) it modulates
+LFO_TARGET_PARAMS = {
+    'cutoff': 'filter_cutoff',
+    'resonance': 'filter_res',
+    'volume': 'master_gain',
+    'pan': 'master_pan',
+    'osc1_level': 'osc_mix_0',
+    'osc2_level': 'osc_mix_1',
+    'osc3_level': 'osc_mix_2'
+}
 
 class SynthesizerGUIV2:
     """GUI for controlling and visualizing the synthesizer parameters"""
@@ -54,14 +79,21 @@ class SynthesizerGUIV2:
         self.master = self.root
         self.master.title("Modular Synthesizer v2")
         self.master.configure(bg='#2e2e2e')
-        self.update_lock = Lock()
         self.running = True
         
         # Handle window close event
         self.master.protocol("WM_DELETE_WINDOW", self.on_close)
         
-        # Initialize LFO
-        self.lfo = LFO()
+        # Track whether the window and plot widget are mapped, so hidden frames skip drawing
+        self._visible = True
+        self._viz_widget = None  # Set once the visualization canvas exists
+        self.master.bind('<Map>', self._on_map_change, add='+')
+        self.master.bind('<Unmap>', self._on_map_change, add='+')
+        
+        # LEDs of oscillators whose mix is a target of the synth LFO
+        self._lfo_route = {}  # {target: [led_tcl_path, last_color]}
+        self._lfo_led_version = -1  # LFO version last shown on the LEDs
+        self._pending = {}  # {key: (setter, args)} awaiting _apply_pending
         
         # Apply dark mode style
         style = ttk.Style()
@@ -71,7 +103,6 @@ class SynthesizerGUIV2:
         style.configure('TButton', background='#4e4e4e', foreground='#ffffff')
         style.configure('TCombobox', fieldbackground='#4e4e4e', background='#4e4e4e', foreground='#ffffff')
         style.configure('TScale', background='#2e2e2e', foreground='#ffffff')
-        style.configure('TProgressbar', background='#4e4e2e', foreground='#ffffff')
         
         # Create main containers
         self.create_main_frame()
@@ -87,9 +118,6 @@ class SynthesizerGUIV2:
         self.create_visualization_frame()
         
         self.update_interval = 1.0 / 60  # 60 FPS
-        
-        # Start update thread
-        Thread(target=self._update_loop, daemon=True).start()
 
         # Add Kill button
         kill_button = tk.Button(self.master, text="Kill", command=self.synth.kill)
@@ -102,6 +130,30 @@ class SynthesizerGUIV2:
         self.lfo_update_id = None  # Store update loop ID
         self._start_lfo_updates()
 
+        # Schedule visualization updates on the Tk event loop
+        self._next_tick = time.perf_counter()  # Frame deadline, so after() jitter does not accumulate
+        self.viz_update_id = self.master.after(16, self._tick)
+
+    def _throttle(self, key, setter, *args, ms=8):
+        """Coalesce rapid slider callbacks into one setter call per key every ms"""
+        first = key not in self._pending
+        self._pending[key] = (setter, args)  # Latest value wins
+        if first:
+            self.master.after(ms, self._apply_pending, key)
+
+    def _update_bpm(self, value):
+        """Set the sequencer tempo from the BPM slider string value"""
+        self.synth.set_sequencer_tempo(float(value))
+
+    def _set_state_float(self, name, value):
+        """Set a STATE attribute from a slider string value"""
+        setattr(STATE, name, float(value))
+
+    def _apply_pending(self, key):
+        """Apply the most recent value queued for a throttled parameter"""
+        setter, args = self._pending.pop(key)
+        setter(*args)
+
     def create_main_frame(self):
         """Create the main frame for the GUI"""
         self.main_frame = ttk.Frame(self.master)
@@ -129,7 +181,7 @@ class SynthesizerGUIV2:
         bpm_slider = ttk.Scale(frame, from_=60, to=200, orient='horizontal')
         bpm_slider.set(120)
         bpm_slider.grid(row=1, column=1)
-        bpm_slider.configure(command=lambda v: self.synth.set_sequencer_tempo(float(v)))
+        bpm_slider.configure(command=partial(self._throttle, 'bpm', self._update_bpm))
 
         # Remove octave shift control
         # ttk.Label(frame, text="Octave Shift").grid(row=2, column=0)
@@ -142,6 +194,7 @@ class SynthesizerGUIV2:
         self.record_led = tk.Canvas(frame, width=20, height=20, bg="gray20", highlightthickness=0)
         self.record_led.create_oval(5, 5, 15, 15, fill="gray")
         self.record_led.grid(row=0, column=2, padx=5)
+        self._record_led_color = "gray"
 
         # Recorded sequence label
         self.sequence_label = ttk.Label(frame, text="Sequence: ")
@@ -159,7 +212,7 @@ class SynthesizerGUIV2:
             self.synth.toggle_sequencer(True)  # Enable sequencer when switched to sequencer mode
         else:
             self.synth.toggle_sequencer(False)  # Disable sequencer when switched to live mode
-        print(f"Play mode set to: {STATE.input_source}")
+        logging.debug("Play mode set to: %s", STATE.input_source)
 
     def _start_record(self):
         """Toggle recording state for the sequencer"""
@@ -168,35 +221,35 @@ class SynthesizerGUIV2:
             STATE.sequencer_recording = False
             self._update_record_led()
             self._update_sequence_label()
-            print("Sequencer recording stopped.")
+            logging.debug("Sequencer recording stopped.")
         else:
             # Start recording
             STATE.sequencer_recording = True
             STATE.sequencer_record_count = 0
             STATE.sequencer_notes = []
             self._update_record_led()
-            print("Recording notes...")
+            logging.debug("Recording notes...")
 
     def _toggle_play_pause(self):
         """Toggle play/pause for the sequencer"""
         STATE.sequencer_enabled = not STATE.sequencer_enabled
         if STATE.sequencer_enabled:
-            print("Sequencer playing...")
+            logging.debug("Sequencer playing...")
         else:
-            print("Sequencer paused...")
+            logging.debug("Sequencer paused...")
 
     def _update_record_led(self):
         """Update the recording LED based on the recording state"""
-        if STATE.sequencer_recording:
-            self.record_led.itemconfig(1, fill="red")
-        else:
-            self.record_led.itemconfig(1, fill="gray")
+        color = "red" if STATE.sequencer_recording else "gray"
+        if color != self._record_led_color:
+            self.record_led.itemconfig(1, fill=color)
+            self._record_led_color = color
 
     def _note_recorded(self):
         """Handle note recorded event"""
         self._update_record_led()
         self._update_sequence_label()
-        print("Note recorded.")
+        logging.debug("Note recorded.")
 
     def _update_sequence_label(self):
         """Update the sequence label with the recorded notes"""
@@ -221,14 +274,14 @@ class SynthesizerGUIV2:
             mix_level = ttk.Scale(frame, from_=0.0, to=1.0, length=100, orient="horizontal")
             mix_level.set(STATE.osc_mix[i])
             mix_level.grid(row=i, column=1, padx=5, pady=5)
-            mix_level.configure(command=lambda val, idx=i: self._update_osc_mix(val, idx))
+            mix_level.configure(command=partial(self._throttle, ('osc_mix', i), self._update_osc_mix, i))
             self.osc_mix_levels.append(mix_level)
             
             # Detune level
             detune = ttk.Scale(frame, from_=-1.0, to=1.0, length=100, orient="horizontal")
             detune.set(STATE.osc_detune[i])
             detune.grid(row=i, column=2, padx=5, pady=5)
-            detune.configure(command=lambda val, idx=i: self._update_osc_detune(val, idx))
+            detune.configure(command=partial(self._throttle, ('osc_detune', i), self._update_osc_detune, i))
             self.osc_detunes.append(detune)
             
             # LFO trigger with LED simulation
@@ -240,31 +293,48 @@ class SynthesizerGUIV2:
             led.grid(row=i, column=4, padx=5, pady=5)
             self.osc_lfo_leds.append(led)
 
-    def _update_osc_mix(self, value, index):
+    def _update_osc_mix(self, index, value):
         """Update oscillator mix level"""
         STATE.osc_mix[index] = float(value)
 
-    def _update_osc_detune(self, value, index):
+    def _update_osc_detune(self, index, value):
         """Update oscillator detune level"""
         STATE.osc_detune[index] = float(value)
 
     def _toggle_lfo_target(self, target):
-        """Toggle LFO target parameter"""
-        if target in self.lfo.targets:
-            self.lfo.remove_target(target)
+        """Toggle an oscillator mix (PARAM_INDEX name) as a target of the synth LFO"""
+        lfo = self.synth.lfo
+        if target in lfo.targets:
+            lfo.remove_target(target)
+            route = self._lfo_route.pop(target, None)  # None if added from the target combobox
+            if route is not None:
+                self.master.tk.eval(f'{route[0]} itemconfigure 1 -fill gray')
         else:
-            base_value = getattr(STATE, target, 0.0)
-            self.lfo.add_target(target, base_value)
+            lfo.add_target(target, float(STATE.params[PARAM_INDEX[target]]))
+            # Route the target to its LED once, so the per-frame update
+            # never has to parse target names
+            led = str(self.osc_lfo_leds[int(target.rsplit('_', 1)[1])])  # Tcl path of the LED canvas
+            self._lfo_route[target] = [led, None]
+            self._lfo_led_version = -1  # Paint the new LED on the next frame
 
     def _update_lfo_leds(self):
         """Update the brightness of the LFO LEDs based on modulation"""
-        for idx, led in enumerate(self.osc_lfo_leds):
-            if f'osc_mix_{idx}' in self.lfo.targets:
-                brightness = int(255 * abs(self.lfo.targets[f'osc_mix_{idx}']))
-                color = f'#{brightness:02x}{brightness:02x}{brightness:02x}'
-                led.itemconfig(1, fill=color)
-            else:
-                led.itemconfig(1, fill="gray")
+        if not self._lfo_route:
+            return
+        lfo = self.synth.lfo
+        if lfo.version == self._lfo_led_version:
+            return
+        self._lfo_led_version = lfo.version
+        brightness = int(255 * min(1.0, abs(lfo.get_value())))
+        color = _GRAY[brightness]
+        # Recolor every changed LED in a single Tcl round-trip
+        script = []
+        for route in self._lfo_route.values():
+            if route[1] != color:
+                script.append(f'{route[0]} itemconfigure 1 -fill {color}')
+                route[1] = color
+        if script:
+            self.master.tk.eval('; '.join(script))
 
     def create_adsr_frame(self):
         """Create the ADSR envelope control frame"""
@@ -290,12 +360,11 @@ class SynthesizerGUIV2:
                 length=200
             )
             slider.grid(row=i, column=1, padx=5, pady=2)
-            
-            # Update function for each parameter
-            def update_adsr(value, param=param.lower()):
-                STATE.adsr[param] = float(value)
-            
-            slider.configure(command=lambda v, p=param.lower(): update_adsr(v, p))
+            slider.configure(command=partial(self._throttle, ('adsr', param.lower()), self._update_adsr, param.lower()))
+
+    def _update_adsr(self, param, value):
+        """Update one ADSR envelope parameter"""
+        STATE.adsr[param] = float(value)
 
     def create_filter_frame(self):
         """Create the filter control frame"""
@@ -318,24 +387,24 @@ class SynthesizerGUIV2:
             # Convert linear slider value to logarithmic frequency
             freq = float(value)
             # Normalize frequency to 0-1 range for the filter
-            normalized = (np.log10(freq) - np.log10(20)) / (np.log10(20000) - np.log10(20))
+            normalized = (math.log10(freq) - _CUTOFF_LOG_LO) / _CUTOFF_LOG_SPAN
             STATE.filter_cutoff = normalized
             
-        cutoff.configure(command=update_cutoff)
+        cutoff.configure(command=partial(self._throttle, 'filter_cutoff', update_cutoff))
         
         # Resonance control
         ttk.Label(frame, text="Resonance").grid(row=1, column=0)
         resonance = ttk.Scale(frame, from_=0, to=1, orient='horizontal')
         resonance.set(STATE.filter_res)
         resonance.grid(row=1, column=1)
-        resonance.configure(command=lambda v: setattr(STATE, 'filter_res', float(v)))
+        resonance.configure(command=partial(self._throttle, 'filter_res', self._set_state_float, 'filter_res'))
         
         # Steepness control (new)
         ttk.Label(frame, text="Steepness").grid(row=2, column=0)
         steepness = ttk.Scale(frame, from_=1, to=4, orient='horizontal')
         steepness.set(STATE.filter_steepness)
         steepness.grid(row=2, column=1)
-        steepness.configure(command=lambda v: setattr(STATE, 'filter_steepness', float(v)))
+        steepness.configure(command=partial(self._throttle, 'filter_steepness', self._set_state_float, 'filter_steepness'))
         
         # Filter type selector
         ttk.Label(frame, text="Type").grid(row=3, column=0)
@@ -358,7 +427,7 @@ class SynthesizerGUIV2:
         self.lfo_rate = ttk.Scale(
             controls, from_=0.1, to=20.0,
             orient="horizontal", length=200,
-            command=lambda v: self._update_lfo_param('frequency', float(v))
+            command=partial(self._throttle, 'lfo_frequency', self._update_lfo_value, 'frequency', 1.0)
         )
         self.lfo_rate.set(1.0)
         self.lfo_rate.grid(row=0, column=1, padx=5, pady=5)
@@ -381,7 +450,7 @@ class SynthesizerGUIV2:
         self.lfo_depth = ttk.Scale(
             controls, from_=0, to=100,
             orient="horizontal", length=200,
-            command=lambda v: self._update_lfo_param('depth', float(v)/100)
+            command=partial(self._throttle, 'lfo_depth', self._update_lfo_value, 'depth', 0.01)  # Percent to 0-1
         )
         self.lfo_depth.set(50)
         self.lfo_depth.grid(row=2, column=1, padx=5, pady=5)
@@ -390,11 +459,7 @@ class SynthesizerGUIV2:
         ttk.Label(controls, text="Target").grid(row=3, column=0, padx=5)
         self.lfo_target = ttk.Combobox(
             controls,
-            values=[
-                'cutoff', 'resonance', 'volume', 'pan', 'pitch',
-                'osc1_level', 'osc2_level', 'osc3_level',
-                'sub_level', 'noise_level'
-            ],
+            values=list(LFO_TARGET_PARAMS),
             state='readonly',
             width=15
         )
@@ -419,11 +484,17 @@ class SynthesizerGUIV2:
         self.lfo_value_label = ttk.Label(viz, text="0%")
         self.lfo_value_label.grid(row=0, column=0, pady=5)
         
-        self.lfo_bar = ttk.Progressbar(
-            viz, orient="vertical",
-            length=200, mode='determinate'
-        )
+        # Plain canvas meter; moving one rectangle is much cheaper than
+        # re-rendering a themed Progressbar every frame
+        self.lfo_bar = tk.Canvas(viz, width=20, height=200, bg='#2e2e2e', highlightthickness=0)
+        self.lfo_bar_rect = self.lfo_bar.create_rectangle(0, 200, 20, 200, fill='#4e4e2e', outline='')
         self.lfo_bar.grid(row=1, column=0, pady=5)
+        self._lfo_meter_percent = None
+        self._lfo_meter_version = -1  # LFO version last shown on the meter
+
+    def _update_lfo_value(self, param, scale, value):
+        """Update a numeric LFO parameter from a slider string value"""
+        self._update_lfo_param(param, float(value) * scale)
 
     def _update_lfo_param(self, param, value):
         """Update LFO parameters"""
@@ -431,10 +502,9 @@ class SynthesizerGUIV2:
             setattr(self.synth.lfo, param, value)
 
     def _update_lfo_target(self, target):
-        """Update LFO target parameter"""
-        if hasattr(self.synth, 'lfo'):
-            current_value = getattr(STATE, target)
-            self.synth.lfo.add_target(target, current_value)
+        """Add the parameter behind a target combobox entry to the synth LFO"""
+        name = LFO_TARGET_PARAMS[target]
+        self.synth.lfo.add_target(name, float(STATE.params[PARAM_INDEX[name]]))
 
     def _update_lfo_display(self):
         """Update LFO visualization bar"""
@@ -443,21 +513,29 @@ class SynthesizerGUIV2:
             value = self.synth.lfo.get_value()
             percent = int((value + 1) * 50)  # Convert -1/1 to 0/100
             
-            # Update progress bar and label
-            self.lfo_bar['value'] = percent
-            self.lfo_value_label['text'] = f"{percent}%"
+            # Update meter and label
+            self._set_lfo_meter(percent)
         
         # Schedule next update
         self.root.after(16, self._update_lfo_display)  # ~60fps refresh
 
+    def _set_lfo_meter(self, percent):
+        """Move the LFO meter and label, skipping unchanged values"""
+        if percent == self._lfo_meter_percent:
+            return
+        self._lfo_meter_percent = percent
+        self.lfo_bar.coords(self.lfo_bar_rect, 0, 200 - 2 * percent, 20, 200)
+        self.lfo_value_label['text'] = f"{percent}%"
+
     def _start_lfo_updates(self):
         """Start LFO visualization updates"""
         def update_loop():
-            if hasattr(self.synth, 'lfo'):
+            # Only query the LFO when it has advanced since the last frame
+            if hasattr(self.synth, 'lfo') and self.synth.lfo.version != self._lfo_meter_version:
+                self._lfo_meter_version = self.synth.lfo.version
                 value = self.synth.lfo.get_value()
                 percent = int((value + 1) * 50)  # Convert -1/1 to 0/100
-                self.lfo_bar['value'] = percent
-                self.lfo_value_label['text'] = f"{percent}%"
+                self._set_lfo_meter(percent)
             self.lfo_update_id = self.root.after(16, update_loop)  # ~60fps
         
         self.lfo_update_id = self.root.after(16, update_loop)
@@ -484,27 +562,34 @@ class SynthesizerGUIV2:
             depth = ttk.Scale(slot_frame, from_=0, to=1, orient='horizontal')
             depth.set(STATE.fx_slots[slot]['depth'])
             depth.grid(row=0, column=2, padx=5, pady=2)
-            depth.configure(command=lambda v, s=slot: self._update_fx_param(s, 'depth', float(v)))
+            depth.configure(command=partial(self._throttle, ('fx', slot, 'depth'), self._update_fx_value, slot, 'depth'))
             
             # Rate control
             ttk.Label(slot_frame, text="Rate").grid(row=0, column=3)
             rate = ttk.Scale(slot_frame, from_=0.1, to=10, orient='horizontal')
             rate.set(STATE.fx_slots[slot]['rate'])
             rate.grid(row=0, column=4, padx=5, pady=2)
-            rate.configure(command=lambda v, s=slot: self._update_fx_param(s, 'rate', float(v)))
+            rate.configure(command=partial(self._throttle, ('fx', slot, 'rate'), self._update_fx_value, slot, 'rate'))
             
             # Mix control
             ttk.Label(slot_frame, text="Mix").grid(row=0, column=5)
             mix = ttk.Scale(slot_frame, from_=0, to=1, orient='horizontal')
             mix.set(STATE.fx_slots[slot]['mix'])
             mix.grid(row=0, column=6, padx=5, pady=2)
-            mix.configure(command=lambda v, s=slot: self._update_fx_param(s, 'mix', float(v)))
+            mix.configure(command=partial(self._throttle, ('fx', slot, 'mix'), self._update_fx_value, slot, 'mix'))
+
+    def _update_fx_value(self, slot, param, value):
+        """Update a numeric effect parameter from a slider string value"""
+        self._update_fx_param(slot, param, float(value))
 
     def _update_fx_param(self, slot, param, value):
         """Update effect parameter for a specific slot"""
         STATE.fx_slots[slot][param] = value
-        STATE.chain_enabled['effects'] = True
-        STATE.chain_bypass['effects'] = False
+        # Enable the effects chain once rather than rewriting the flags on every drag event
+        if not STATE.chain_enabled['effects']:
+            STATE.chain_enabled['effects'] = True
+        if STATE.chain_bypass['effects']:
+            STATE.chain_bypass['effects'] = False
 
     def create_amp_frame(self):
         """Create the amp control frame"""
@@ -516,14 +601,14 @@ class SynthesizerGUIV2:
         master = ttk.Scale(frame, from_=0, to=1, orient='horizontal')
         master.set(STATE.master_gain)
         master.grid(row=0, column=1)
-        master.configure(command=lambda v: setattr(STATE, 'master_gain', float(v)))
+        master.configure(command=partial(self._throttle, 'master_gain', self._set_state_float, 'master_gain'))
         
         # Pan control
         ttk.Label(frame, text="Pan").grid(row=1, column=0)
         pan = ttk.Scale(frame, from_=-1, to=1, orient='horizontal')
         pan.set(STATE.master_pan)
         pan.grid(row=1, column=1)
-        pan.configure(command=lambda v: setattr(STATE, 'master_pan', float(v)))
+        pan.configure(command=partial(self._throttle, 'master_pan', self._set_state_float, 'master_pan'))
 
     def create_post_oscillator_frame(self):
         """Create the post-oscillator control frame"""
@@ -537,21 +622,21 @@ class SynthesizerGUIV2:
         sub_amount = ttk.Scale(frame, from_=0.0, to=1.0, length=100, orient="horizontal")
         sub_amount.set(STATE.sub_amount)
         sub_amount.grid(row=1, column=1, padx=5, pady=5)
-        sub_amount.configure(command=lambda val: self._update_sub_amount(val))
+        sub_amount.configure(command=partial(self._throttle, 'sub_amount', self._update_sub_amount))
         
         # Harmonics
         ttk.Label(frame, text="Harmonics").grid(row=0, column=2, padx=5, pady=5)
         noise_harmonics = ttk.Scale(frame, from_=0.0, to=1.0, length=100, orient="horizontal")
         noise_harmonics.set(STATE.noise_harmonics)
         noise_harmonics.grid(row=1, column=2, padx=5, pady=5)
-        noise_harmonics.configure(command=lambda val: self._update_noise_harmonics(val))
+        noise_harmonics.configure(command=partial(self._throttle, 'noise_harmonics', self._update_noise_harmonics))
         
         # Inharmonicity
         ttk.Label(frame, text="Inharmonicity").grid(row=0, column=3, padx=5, pady=5)
         noise_inharmonicity = ttk.Scale(frame, from_=0.0, to=1.0, length=100, orient="horizontal")
         noise_inharmonicity.set(STATE.noise_inharmonicity)
         noise_inharmonicity.grid(row=1, column=3, padx=5, pady=5)
-        noise_inharmonicity.configure(command=lambda val: self._update_noise_inharmonicity(val))
+        noise_inharmonicity.configure(command=partial(self._throttle, 'noise_inharmonicity', self._update_noise_inharmonicity))
 
     def _update_noise_amount(self, value):
         # Removed or commented out since it's no longer used
@@ -588,63 +673,167 @@ class SynthesizerGUIV2:
         frame = ttk.LabelFrame(self.main_frame, text="Visualization", padding=(10, 5))
         frame.grid(row=4, column=0, columnspan=3, padx=5, pady=5, sticky="nsew")
         
-        # Create waveform plot
-        self.waveform_fig, self.waveform_ax = plt.subplots(figsize=(5, 2))
-        self.waveform_fig.patch.set_facecolor('#2e2e2e')
+        # Waveform and spectrum share one figure and one Tk canvas
+        self.viz_fig = Figure(figsize=(10, 2))
+        self.viz_fig.patch.set_facecolor('#2e2e2e')
+        self.waveform_ax, self.spectrum_ax = self.viz_fig.subplots(1, 2)
+        self.viz_canvas = FigureCanvasTkAgg(self.viz_fig, master=frame)
+        self._viz_widget = self.viz_canvas.get_tk_widget()
+        self._viz_widget.grid(row=0, column=0, padx=5, pady=5)
+        
+        # Waveform plot
         self.waveform_ax.set_facecolor('#2e2e2e')
-        self.waveform_canvas = FigureCanvasTkAgg(self.waveform_fig, master=frame)
-        self.waveform_canvas.get_tk_widget().grid(row=0, column=0, padx=5, pady=5)
         self.waveform_ax.set_title("Waveform", color='white')
         self.waveform_ax.set_xlim(0, 1024)
         self.waveform_ax.set_ylim(-1, 1)
-        self.waveform_ax.tick_params(axis='x', colors='white')
-        self.waveform_ax.tick_params(axis='y', colors='white')
-        self.waveform_line, = self.waveform_ax.plot([], [], lw=1, color='red')
+        self.waveform_ax.set_xticks([])  # Only the shape matters; no tick labels to render
+        self.waveform_ax.set_yticks([])
+        self.waveform_line, = self.waveform_ax.plot([], [], lw=1, color='red', animated=True)
+        self._xaxis = np.arange(1024, dtype=np.float32)  # Reused x data for line plots
+        self._wave_points = 2048  # Max waveform points to plot, refreshed from the axes width on draw
         
-        # Create spectrum plot
-        self.spectrum_fig, self.spectrum_ax = plt.subplots(figsize=(5, 2))
-        self.spectrum_fig.patch.set_facecolor('#2e2e2e')
+        # Spectrum plot
         self.spectrum_ax.set_facecolor('#2e2e2e')
-        self.spectrum_canvas = FigureCanvasTkAgg(self.spectrum_fig, master=frame)
-        self.spectrum_canvas.get_tk_widget().grid(row=0, column=1, padx=5, pady=5)
         self.spectrum_ax.set_title("Spectrum", color='white')
         self.spectrum_ax.set_xlim(20, 20000)  # Set frequency range from 20 Hz to 20 kHz
         self.spectrum_ax.set_ylim(-100, 100)  # Set dB range from -100 to +100
         self.spectrum_ax.set_xscale('log')  # Use logarithmic scale for x-axis
         self.spectrum_ax.tick_params(axis='x', colors='white')
         self.spectrum_ax.tick_params(axis='y', colors='white')
-        self.spectrum_line, = self.spectrum_ax.plot([], [], lw=1, color='red')
+        self.spectrum_line, = self.spectrum_ax.plot([], [], lw=1, color='red', animated=True)
+        self._spectrum_n = 0  # Buffer length the spectrum x data was built for
+        self._spectrum_silent = False  # Spectrum line currently shows the silence floor
+        
+        # Limits are fixed, so never relimit/autoscale when line data changes
+        self.waveform_ax.set_autoscale_on(False)
+        self.spectrum_ax.set_autoscale_on(False)
+        self._last_write = -1  # Monitor write index of the last drawn signal
+        self.max_redraw_rate = 30  # Hz; caps scope redraws independently of the tick rate
+        self._last_redraw = 0.0
+        
+        # Blitting: axes, ticks and titles are rendered once into a cached
+        # background; each frame only the two lines are redrawn over it.
+        # Any full draw (first show, resize) recaptures the background.
+        self._viz_bg = None
+        self.viz_canvas.mpl_connect('draw_event', self._on_viz_draw)
 
     def _update_visualization(self):
         """Update waveform and spectrum visualization"""
+        # Nothing to draw while the window is minimized or hidden
+        if not self._visible:
+            return
+        now = time.perf_counter()
+        if now - self._last_redraw < 1.0 / self.max_redraw_rate:
+            return
+        # Only fetch and draw once the audio thread has pushed new samples
+        write = DEBUG.get_signal_version('audio_out')
+        if write == self._last_write:
+            return
+        self._last_write = write
+        self._last_redraw = now
         signal_data = DEBUG.get_signal_data('audio_out')
         if len(signal_data) > 0:
+            silent = np.max(np.abs(signal_data)) < 1e-4  # Silence between notes needs no FFT
             self._draw_waveform(signal_data)
-            self._draw_spectrum(signal_data)
-        
-        # Force GUI elements update
-        self.master.update()
+            self._draw_spectrum(signal_data, silent)
+            self._blit_visualization()
+
+    def _on_map_change(self, event):
+        """Record map/unmap of the main window or plot widget (other child events also reach this binding)"""
+        if event.widget is self.master or event.widget is self._viz_widget:
+            # Viewable means the widget and all its ancestors are mapped
+            if self._viz_widget is None:
+                self._visible = event.type == tk.EventType.Map
+            else:
+                self._visible = bool(self._viz_widget.winfo_viewable())
+
+    def _on_viz_draw(self, event):
+        """Cache the static figure background after a full redraw"""
+        self._viz_bg = self.viz_canvas.copy_from_bbox(self.viz_fig.bbox)
+        self._wave_points = max(2, 2 * int(self.waveform_ax.bbox.width))
+        self.waveform_ax.draw_artist(self.waveform_line)
+        self.spectrum_ax.draw_artist(self.spectrum_line)
+
+    def _blit_visualization(self):
+        """Redraw only the plot lines over the cached background"""
+        if self._viz_bg is None:
+            self.viz_canvas.draw_idle()  # Background not captured yet
+            return
+        self.viz_canvas.restore_region(self._viz_bg)
+        self.waveform_ax.draw_artist(self.waveform_line)
+        self.spectrum_ax.draw_artist(self.spectrum_line)
+        self.viz_canvas.blit(self.viz_fig.bbox)
 
     def _draw_waveform(self, data):
         """Draw the waveform on the canvas"""
-        if len(data) > 0:
-            self.waveform_line.set_data(np.arange(len(data)), data)
-            self.waveform_canvas.draw()
+        n = len(data)
+        if n > 0:
+            if n > len(self._xaxis):
+                self._xaxis = np.arange(n, dtype=np.float32)
+            k = n // self._wave_points
+            if k > 1:
+                # Min/max envelope per block of k samples, about two points per pixel
+                m = n // k
+                blocks = data[:m * k].reshape(m, k)
+                envelope = np.empty(2 * m, dtype=data.dtype)
+                envelope[0::2] = blocks.min(axis=1)
+                envelope[1::2] = blocks.max(axis=1)
+                self.waveform_line.set_data(np.repeat(self._xaxis[:m * k:k], 2), envelope)
+            else:
+                self.waveform_line.set_data(self._xaxis[:n], data)
 
-    def _draw_spectrum(self, data):
+    def _draw_spectrum(self, data, silent=False):
         """Draw the spectrum on the canvas"""
-        if len(data) > 0:
-            spectrum = np.abs(np.fft.rfft(data))  # Use more frequency bins
-            spectrum = 20 * np.log10(spectrum + 1e-6)  # Apply logarithmic scaling
-            freqs = np.fft.rfftfreq(len(data), 1 / AUDIO_CONFIG.SAMPLE_RATE)
-            self.spectrum_line.set_data(freqs, spectrum)
-            self.spectrum_canvas.draw()
+        # Axis scale and limits are fixed at construction; only the line data
+        # changes here. For much higher refresh rates a dedicated plotting
+        # backend (e.g. pyqtgraph) would be the next step.
+        if len(data) < SPECTRUM_FFT_SIZE:
+            return  # Not enough samples yet for a full-size transform
+        data = data[-SPECTRUM_FFT_SIZE:]
+        n = len(data)
+        if n > 0:
+            if n != self._spectrum_n:
+                # Window and frequency axis only depend on the buffer length
+                self._spectrum_n = n
+                self._window = np.hanning(n).astype(np.float32)
+                self._windowed = np.empty(n, dtype=np.float32)
+                self._fft_out = np.empty(n // 2 + 1, dtype=np.complex64)  # NumPy 2 runs float32 FFTs natively
+                self._magnitude = np.empty(n // 2 + 1, dtype=np.float32)
+                # Group the linear FFT bins into log-spaced display bins (low
+                # bins that fall on the same FFT bin collapse into one)
+                freqs = np.fft.rfftfreq(n, 1 / AUDIO_CONFIG.SAMPLE_RATE)
+                edges = np.searchsorted(freqs, np.geomspace(20, 20000, SPECTRUM_BINS))
+                self._logbin_edges = np.unique(np.minimum(edges, len(freqs) - 1))
+                self._binned = np.empty(len(self._logbin_edges), dtype=np.float32)
+                self.spectrum_line.set_data(freqs[self._logbin_edges], self._binned)
+                self._spectrum_silent = False
+            if silent:
+                # Flat floor below the visible dB range, written once per silent stretch
+                if not self._spectrum_silent:
+                    self._binned.fill(20 * np.log10(1e-6))
+                    self.spectrum_line.set_ydata(self._binned)
+                    self._spectrum_silent = True
+                return
+            self._spectrum_silent = False
+            # Hann window reduces leakage so peaks stand out
+            np.multiply(data, self._window, out=self._windowed)
+            # Transform and post-process in preallocated buffers
+            np.fft.rfft(self._windowed, out=self._fft_out)
+            np.abs(self._fft_out, out=self._magnitude)
+            spectrum = self._binned
+            np.maximum.reduceat(self._magnitude, self._logbin_edges, out=spectrum)  # Peak per display bin
+            spectrum += 1e-6
+            np.log10(spectrum, out=spectrum)
+            spectrum *= 20  # Apply logarithmic scaling
+            self.spectrum_line.set_ydata(spectrum)
 
     def stop(self):
         """Stop the GUI update loop"""
         self.running = False
         if self.lfo_update_id:
             self.root.after_cancel(self.lfo_update_id)
+        if self.viz_update_id:
+            self.root.after_cancel(self.viz_update_id)
 
     def on_close(self):
         """Handle the GUI window close event"""
@@ -653,12 +842,20 @@ class SynthesizerGUIV2:
         self.synth.stop()
         print("GUI closed and script stopped.")
 
-    def _update_loop(self):
-        """Periodic update loop for the GUI"""
-        while self.running:
-            with self.update_lock:
-                self._update_visualization()
-            time.sleep(self.update_interval)
+    def _tick(self):
+        """Periodic update for the GUI, run on the Tk event loop"""
+        if not self.running:
+            return
+        self._update_visualization()
+        self._update_lfo_leds()
+        # Wait until the next frame deadline; after an overrun, drop the missed
+        # frames and restart from now instead of firing them back to back
+        now = time.perf_counter()
+        self._next_tick += self.update_interval
+        if self._next_tick < now:
+            self._next_tick = now + self.update_interval
+        delay = max(1, int((self._next_tick - now) * 1000))
+        self.viz_update_id = self.master.after(delay, self._tick)
 
 def create_gui_v2(synth):
     """Create and return the main GUI window"""
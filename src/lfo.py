@@ -4,8 +4,9 @@ LFO (Low-Frequency Oscillator) Module
 Generates LFO waveforms and routes them to parameters.
 """
 
+import math
 import numpy as np
-from config import STATE, AUDIO_CONFIG
+from config import STATE, AUDIO_CONFIG, PARAM_INDEX
 
 # Update PARAMETER_RANGES
 PARAMETER_RANGES = {
@@ -25,7 +26,51 @@ PARAMETER_RANGES = {
     'osc2_mix': (0, 1),
     'osc3_mix': (0, 1),
     'osc4_mix': (0, 1),
-    'osc5_mix': (0, 1)
+    'osc5_mix': (0, 1),
+    # Ranges for parameters stored in STATE.params (per-oscillator entries share one range)
+    'osc_mix': (0, 1),
+    'osc_detune': (-1, 1),
+    'osc_harmonics': (0, 1),
+    'filter_cutoff': (0, 1),
+    'filter_res': (0, 1),
+    'master_gain': (0, 1),
+    'master_pan': (-1, 1)
+}
+
+def _param_range(name):
+    """Range for a STATE.params entry, falling back to its per-oscillator group"""
+    return PARAMETER_RANGES.get(name) or PARAMETER_RANGES.get(name.rsplit('_', 1)[0])
+
+# Single-cycle lookup tables for each waveform, indexed by phase * TABLE_SIZE
+TABLE_BITS = 12
+TABLE_SIZE = 1 << TABLE_BITS
+PHASE_SCALE = 2.0 ** 32  # One cycle in 32-bit fixed-point phase
+_TABLE_PHASE = np.arange(TABLE_SIZE) / TABLE_SIZE
+WAVE_TABLES = {
+    'sine': np.sin(2 * np.pi * _TABLE_PHASE).astype(np.float32),
+    'triangle': (2 * np.abs(2 * (_TABLE_PHASE - np.floor(_TABLE_PHASE + 0.5))) - 1).astype(np.float32),
+    'square': np.where(_TABLE_PHASE < 0.5, 1.0, -1.0).astype(np.float32),  # No sign(0) cell at phase 0
+    'saw': (2 * (_TABLE_PHASE - np.floor(_TABLE_PHASE)) - 1).astype(np.float32)
+}
+
+def _sine(t):
+    return np.sin(2 * np.pi * t)
+
+def _triangle(t):
+    return 2 * np.abs(2 * (t - np.floor(t + 0.5))) - 1
+
+def _square(t):
+    return np.sign(np.sin(2 * np.pi * t))
+
+def _saw(t):
+    return 2 * (t - np.floor(t)) - 1
+
+# Closed-form waveform per name, as a function of phase (0-1); unknown names fall back to saw
+WAVE_FUNCTIONS = {
+    'sine': _sine,
+    'triangle': _triangle,
+    'square': _square,
+    'saw': _saw
 }
 
 class LFO:
@@ -35,46 +80,73 @@ class LFO:
         self.frequency = frequency
         self.waveform = waveform
         self.offset = offset
-        self.depth = np.clip(depth, 0, 1)  # Normalize depth to 0-1
+        self.depth = float(np.clip(depth, 0, 1))  # Normalize depth to 0-1
         self.phase = 0.0
         self.enabled = True
         self.bypassed = False
         self.sample_rate = AUDIO_CONFIG.SAMPLE_RATE
         self.targets = {}  # Dictionary to store {param_name: (base_value, param_type)}
+        self._param_idx = np.zeros(0, dtype=np.intp)  # STATE.params indices modulated in one write
+        self._param_min = np.zeros(0, dtype=np.float32)
+        self._param_max = np.zeros(0, dtype=np.float32)
+        self._param_base = np.zeros(0, dtype=np.float32)  # Base values, for process()
+        self._param_center = np.zeros(0, dtype=np.float32)  # Range midpoints, for generate()
+        self._param_half = np.zeros(0, dtype=np.float32)  # Half ranges
         self.current_value = 0.0
+        self.version = 0  # Bumped whenever the LFO output may have changed
+        self._ramp = np.zeros(0, dtype=np.uint32)  # Scratch buffers for generate(), sized on first use
+        self._idx = np.zeros(0, dtype=np.uint32)
         self.last_time = 0
         self.viz_buffer_size = 1000
-        self.viz_buffer = np.zeros(self.viz_buffer_size)
+        self.viz_buffer = np.zeros(self.viz_buffer_size, dtype=np.float32)
         self.viz_index = 0
 
+    @property
+    def waveform(self):
+        return self._waveform
+
+    @waveform.setter
+    def waveform(self, waveform):
+        # Resolve the waveform once here instead of branching on its name per call
+        self._waveform = waveform
+        self._wave_fn = WAVE_FUNCTIONS.get(waveform, _saw)
+        self._table = WAVE_TABLES.get(waveform, WAVE_TABLES['saw'])
+
     def set_parameters(self, frequency, waveform, offset, depth):
         """Set LFO parameters"""
         self.frequency = frequency
         self.waveform = waveform
         self.offset = offset
-        self.depth = np.clip(depth, 0, 1)
+        self.depth = float(np.clip(depth, 0, 1))
+        self.version += 1
 
     def add_target(self, target_name, base_value):
         """Add or update a modulation target"""
         self.targets[target_name] = (base_value, target_name)
+        self._bind_targets()
 
     def remove_target(self, target_name):
         """Remove a target parameter"""
         if target_name in self.targets:
             del self.targets[target_name]
+            self._bind_targets()
 
-    def _scale_value(self, raw_value, param_type):
-        """Scale raw LFO value (-1 to 1) to parameter range"""
-        if param_type not in PARAMETER_RANGES:
-            return raw_value
-            
-        min_val, max_val = PARAMETER_RANGES[param_type]
-        center = (max_val + min_val) / 2
-        range_half = (max_val - min_val) / 2
-        
-        # Scale the raw value (-1 to 1) to parameter range
-        scaled = center + (raw_value * range_half * self.depth)
-        return np.clip(scaled, min_val, max_val)
+    def _bind_targets(self):
+        """Resolve PARAM_INDEX targets to STATE.params indices and ranges once, outside the audio path"""
+        idx, bases, mins, maxs = [], [], [], []
+        for target_name, (base_value, param_type) in self.targets.items():
+            if target_name in PARAM_INDEX and _param_range(target_name):
+                min_val, max_val = _param_range(target_name)
+                idx.append(PARAM_INDEX[target_name])
+                bases.append(base_value)
+                mins.append(min_val)
+                maxs.append(max_val)
+        self._param_idx = np.array(idx, dtype=np.intp)
+        self._param_min = np.array(mins, dtype=np.float32)
+        self._param_max = np.array(maxs, dtype=np.float32)
+        self._param_base = np.array(bases, dtype=np.float32)
+        self._param_center = (self._param_max + self._param_min) * 0.5
+        self._param_half = (self._param_max - self._param_min) * 0.5
 
     def process(self):
         """Process LFO and update target parameters"""
@@ -82,101 +154,73 @@ class LFO:
             return
             
         # Generate basic LFO value
-        if self.waveform == 'sine':
-            value = np.sin(2 * np.pi * self.phase)
-        elif self.waveform == 'triangle':
-            value = 2 * abs(2 * (self.phase - np.floor(self.phase + 0.5))) - 1
-        elif self.waveform == 'square':
-            value = np.sign(np.sin(2 * np.pi * self.phase))
-        else:  # saw
-            value = 2 * (self.phase - np.floor(self.phase)) - 1
+        value = self._wave_fn(self.phase)
             
         # Update phase
         self.phase += self.frequency / self.sample_rate
         if self.phase >= 1.0:
             self.phase -= 1.0
+        self.version += 1
             
         # Apply depth and offset
         value = value * self.depth + self.offset
         
-        # Update target parameters
-        for target_name, (base_value, param_type) in self.targets.items():
-            if hasattr(STATE, target_name):
-                # Get parameter range
-                min_val, max_val = PARAMETER_RANGES[param_type]
-                
-                # Scale LFO value to parameter range
-                param_range = max_val - min_val
-                center = base_value
-                modulation = (value * param_range * self.depth) / 2
-                new_value = np.clip(center + modulation, min_val, max_val)
-                
-                # Update parameter in STATE
-                setattr(STATE, target_name, new_value)
-
-    def generate(self, buffer_size):
-        """Generate LFO samples for audio buffer"""
+        # Update all target parameters in one STATE.params write
+        if self._param_idx.size:
+            STATE.params[self._param_idx] = np.clip(self._param_base + value * self.depth * self._param_half,
+                                                    self._param_min, self._param_max)
+
+    def generate(self, buffer_size, out=None):
+        """Generate LFO samples for audio buffer, optionally into a preallocated out array"""
         if self.bypassed:
-            return np.zeros(buffer_size)
-
-        # Calculate time points for this buffer
-        t = np.linspace(self.phase, 
-                       self.phase + (self.frequency * buffer_size / self.sample_rate),
-                       buffer_size, endpoint=False)
-
-        # Generate waveform
-        if self.waveform == 'sine':
-            values = np.sin(2 * np.pi * t)
-        elif self.waveform == 'triangle':
-            values = 2 * np.abs(2 * (t - np.floor(t + 0.5))) - 1
-        elif self.waveform == 'square':
-            values = np.sign(np.sin(2 * np.pi * t))
-        else:  # saw
-            values = 2 * (t - np.floor(t)) - 1
-
-        # Update phase for next buffer
-        self.phase = t[-1]
-        while self.phase >= 1.0:
-            self.phase -= 1.0
+            if out is None:
+                return np.zeros(buffer_size, dtype=np.float32)
+            out[:buffer_size] = 0.0
+            return out[:buffer_size]
+
+        # Look up the waveform table with a 32-bit fixed-point phase
+        # accumulator: uint32 arithmetic wraps at one cycle by itself, and the
+        # top TABLE_BITS bits are the table index. Scratch buffers are only
+        # reallocated when the block size grows.
+        if len(self._ramp) < buffer_size:
+            self._ramp = np.arange(buffer_size, dtype=np.uint32)
+            self._idx = np.empty(buffer_size, dtype=np.uint32)
+        step = self.frequency / self.sample_rate
+        idx = self._idx[:buffer_size]
+        np.multiply(self._ramp[:buffer_size], np.uint32(int(step * PHASE_SCALE) & 0xFFFFFFFF), out=idx)
+        idx += np.uint32(int(self.phase * PHASE_SCALE) & 0xFFFFFFFF)
+        idx >>= 32 - TABLE_BITS
+        table = self._table
+        values = table[idx] if out is None else np.take(table, idx, out=out[:buffer_size])
+
+        # Leave the phase on the block's last sample; process(), run after each
+        # block, takes the final one-sample step
+        phase = self.phase + (buffer_size - 1) * step
+        self.phase = phase - math.floor(phase)  # Keep phase in [0, 1)
+        self.version += 1
 
         # Apply depth and offset
-        values = values * self.depth + self.offset
+        values *= self.depth
+        values += self.offset
 
-        # Update parameters
-        for target_name, (base_value, param_type) in self.targets.items():
-            if hasattr(STATE, target_name):
-                scaled = self._scale_value(values[-1], param_type)
-                setattr(STATE, target_name, scaled)
+        # Update all target parameters in a single STATE.params scatter
+        if self._param_idx.size:
+            last = values[-1]
+            STATE.params[self._param_idx] = np.clip(self._param_center + last * self.depth * self._param_half,
+                                                    self._param_min, self._param_max)
 
         return values
 
     def get_waveform(self, t):
         """Get waveform values for visualization"""
-        if self.waveform == 'sine':
-            return np.sin(2 * np.pi * t) * self.depth + self.offset
-        elif self.waveform == 'triangle':
-            return (2 * np.abs(2 * (t - np.floor(t + 0.5))) - 1) * self.depth + self.offset
-        elif self.waveform == 'square':
-            return np.sign(np.sin(2 * np.pi * t)) * self.depth + self.offset
-        else:
-            return (2 * (t - np.floor(t)) - 1) * self.depth + self.offset
+        return self._wave_fn(t) * self.depth + self.offset
 
     def get_value(self):
         """Get current normalized LFO value (-1 to 1)"""
         if self.bypassed:
             return 0.0
             
-        t = self.phase
-        if self.waveform == 'sine':
-            value = np.sin(2 * np.pi * t)
-        elif self.waveform == 'triangle':
-            value = 2 * np.abs(2 * (t - np.floor(t + 0.5))) - 1
-        elif self.waveform == 'square':
-            value = np.sign(np.sin(2 * np.pi * t))
-        else:  # saw
-            value = 2 * (t - np.floor(t)) - 1
-            
-        return value * self.depth + self.offset
+        return self._wave_fn(self.phase) * self.depth + self.offset
 
     def enable(self):
         """Enable the LFO"""
@@ -197,20 +241,10 @@ class LFO:
     def get_visualization_data(self):
         """Generate visualization data for GUI"""
         if self.bypassed:
-            return np.zeros(self.viz_buffer_size)
-            
-        t = np.linspace(0, 1, self.viz_buffer_size)
-        
-        if self.waveform == 'sine':
-            values = np.sin(2 * np.pi * t)
-        elif self.waveform == 'triangle':
-            values = 2 * np.abs(2 * (t - np.floor(t + 0.5))) - 1
-        elif self.waveform == 'square':
-            values = np.sign(np.sin(2 * np.pi * t))
-        else:  # saw
-            values = 2 * (t - np.floor(t)) - 1
+            return np.zeros(self.viz_buffer_size, dtype=np.float32)
             
-        return values * self.depth + self.offset
+        t = np.linspace(0, 1, self.viz_buffer_size, dtype=np.float32)
+        return self._wave_fn(t) * self.depth + self.offset
 
     def update_visualization(self):
         """Update visualization buffer with current values"""
@@ -6,67 +6,39 @@ Main Application Entry
 - Basic error handling
 """
 
+import sys
 import tkinter as tk
-import sounddevice as sd
-import mido
 from core import Synthesizer
 from midi import MIDIHandler
+from device_setup import select_output_device, select_midi_device, get_output_devices
 from gui_v2 import create_gui_v2
 from debug import DEBUG
 from noise_sub_module import NoiseSubModule
 
-def force_realtek_device():
-    """Force the use of a Realtek audio device if available"""
-    devices = sd.query_devices()
-    DEBUG.log("\nAvailable Audio Output Devices:")
-    DEBUG.log("-" * 50)
-    
-    # Find and force Realtek device
-    realtek_device = None
-    for i, device in enumerate(devices):
-        DEBUG.log(f"{i}: {device['name']}")
-        if 'Realtek' in device['name'] and device['max_output_channels'] > 0:
-            realtek_device = i
-            DEBUG.log(f"\nForcing Realtek device: {device['name']}")
-            break
-    
-    if realtek_device is None:
-        DEBUG.log("No Realtek device found! Using default")
-        return sd.default.device[1]
-        
-    return realtek_device
-
-def select_midi_device():
-    """Select MIDI input device"""
-    midi_devices = mido.get_input_names()
-    DEBUG.log(f"\nFound MIDI devices: {midi_devices}")
-    
-    if not midi_devices:
-        DEBUG.log("No MIDI devices found!")
-        return None
-        
-    # Auto-select first device
-    selected_device = midi_devices[0]
-    DEBUG.log(f"Auto-selected MIDI device: {selected_device}")
-    return selected_device
-
 def main():
     """Initialize and run the synthesizer"""
+    # Hand the GIL over more often (default 5 ms) so the audio callback
+    # thread is not held up behind long-running Tk/Matplotlib work
+    sys.setswitchinterval(0.001)
     try:
-        # Force Realtek audio device
-        output_device = force_realtek_device()
+        # Select audio output device (ASIO/JACK, else Realtek)
+        output_device = select_output_device()
         DEBUG.log(f"Selected audio output device: {output_device}")
         
         # Select MIDI device
         midi_device = select_midi_device()
         DEBUG.log(f"Selected MIDI device: {midi_device}")
         
-        # Create synth with forced Realtek device
-        synth = Synthesizer(device=output_device)
+        # Create synth on the selected device, asking for its low-latency buffer size
+        latency = None  # Falls back to AUDIO_CONFIG.LATENCY for the PortAudio default device
+        if isinstance(output_device, int) and output_device >= 0:
+            latency = get_output_devices()[output_device]['default_low_output_latency']
+        synth = Synthesizer(device=output_device, latency=latency)
         DEBUG.log("Synthesizer initialized")
         
         # Create and initialize MIDI handler with device selection
         midi = MIDIHandler(midi_device)
+        synth.midi = midi  # CCs are applied by the audio callback once per block
         DEBUG.log("MIDI handler initialized")
         
         # Create NoiseSubModule and set parameters
@@ -83,17 +55,8 @@ def main():
         synth.start()
         DEBUG.log("Synth started - ready for MIDI input")
         
-        # Connect MIDI callbacks
-        def midi_callback(event_type, note, velocity):
-            DEBUG.log(f"MIDI callback: {event_type}, Note: {note}, Velocity: {velocity}")
-            print(f"MIDI callback: {event_type}, Note: {note}, Velocity: {velocity}")  # Print MIDI callback details
-            if event_type == 'note_on':
-                synth.note_on(note, velocity)
-            elif event_type == 'note_off':
-                synth.note_off(note)
-        
-        # Start MIDI handling
-        midi.start(midi_callback)
+        # Start MIDI handling, routing notes straight to the synth
+        midi.start(note_on=synth.note_on, note_off=synth.note_off)
         DEBUG.log("MIDI handling started")
         
         try:
@@ -8,7 +8,7 @@ Features:
    - Device detection and selection
    - Hot-plugging support
    - Error handling and recovery
-   - Thread-safe event queue
+   - Direct dispatch from the input thread (no event queue)
 
 2. Event Processing:
    - Note on/off handling
@@ -17,39 +17,92 @@ Features:
    - Real-time parameter updates
 
 3. Control Mapping:
-   - Oscillator mix levels (CC 14-17)
-   - Oscillator detune (CC 26-29)
+   - Oscillator mix levels (CC 14-17, 24)
+   - Oscillator detune (CC 26-30)
    - Filter controls (CC 22-23)
    - ADSR parameters (CC 18-21)
 
 4. Thread Management:
    - Asynchronous MIDI processing
-   - Event queueing
    - Resource cleanup
 """
 
 import mido
 import time
+from functools import partial
 from typing import Callable
-from queue import Queue
-from threading import Thread, Lock
-from config import MIDI_CONFIG, STATE
+from config import MIDI_CONFIG, STATE, P_OSC_MIX, P_OSC_DETUNE, P_FILTER_CUTOFF, P_FILTER_RES
 from debug import DEBUG
+from device_setup import get_input_names
 from mido import MidiFile, MidiTrack, Message
 
+# CC value (0-127) -> 0.0-1.0, so handling a CC needs no division
+_NORM = tuple(i / 127.0 for i in range(128))
+
+# ADSR CC order and the slider range each one maps onto (seconds, or level for sustain)
+ADSR_CC_PARAMS = (('attack', 2.0), ('decay', 2.0), ('sustain', 1.0), ('release', 1.0))
+
+# System messages the synth never uses; MIDI clock alone can arrive hundreds of times a second
+IGNORED_MESSAGE_TYPES = frozenset(('clock', 'active_sensing', 'sysex', 'start', 'stop', 'continue'))
+
+def _set_param(index, scale, offset, value):
+    """Write a normalized CC value into STATE.params"""
+    STATE.params[index] = value * scale + offset
+
+def _set_adsr(param, scale, value):
+    """Write a normalized CC value into STATE.adsr"""
+    STATE.adsr[param] = value * scale
+
 class MIDIHandler:
     """Handles MIDI input and routes events to the synthesizer"""
     
     def __init__(self, device_name=None):
         self.callback = None
+        self._note_on = None   # note_on(note, velocity), bound in start()
+        self._note_off = None  # note_off(note, velocity)
         self.input_port = None
         self.device_name = device_name
-        self.lock = Lock()
+        self._cc_map = self._build_cc_map()  # {cc: setter(normalized_value)}
+        self._last_cc = bytearray(b'\xff' * 128)  # Last value per CC number; 0xff = none yet
+        self._pending = {}  # {cc: value} received since the last audio block; latest value wins
+
+    def _build_cc_map(self):
+        """Resolve every mapped CC number to its parameter setter once"""
+        cc_map = {}
+        for i, cc in enumerate(MIDI_CONFIG.OSC_MIX_CCS):
+            cc_map[cc] = partial(_set_param, P_OSC_MIX + i, 1.0, 0.0)
+        for i, cc in enumerate(MIDI_CONFIG.OSC_DETUNE_CCS):
+            cc_map[cc] = partial(_set_param, P_OSC_DETUNE + i, 2.0, -1.0)  # -1 to 1
+        cc_map[MIDI_CONFIG.FILTER_CUTOFF_CC] = partial(_set_param, P_FILTER_CUTOFF, 1.0, 0.0)
+        cc_map[MIDI_CONFIG.FILTER_RES_CC] = partial(_set_param, P_FILTER_RES, 1.0, 0.0)
+        # ADSR CCs are disjoint from the mix CCs, so map order does not matter
+        for cc, (param, scale) in zip(MIDI_CONFIG.ADSR_CCS, ADSR_CC_PARAMS):
+            cc_map[cc] = partial(_set_adsr, param, scale)
+        return cc_map
+
+    def _handle_cc(self, control, value):
+        """Record a control change; apply_pending() applies it at the next audio block"""
+        if self._last_cc[control] == value:
+            return  # Repeated value, nothing to update
+        self._last_cc[control] = value
+        if control in self._cc_map:
+            self._pending[control] = value  # Single dict store, atomic under the GIL
+
+    def apply_pending(self):
+        """Apply the CCs received since the last call; called once per audio block"""
+        # popitem() is atomic, so the MIDI thread can keep adding entries meanwhile
+        pending = self._pending
+        cc_map = self._cc_map
+        while pending:
+            control, value = pending.popitem()
+            cc_map[control](_NORM[value])
         
-    def start(self, callback: Callable):
-        """Start MIDI input and set the callback for MIDI events"""
+    def start(self, callback: Callable = None, note_on: Callable = None, note_off: Callable = None):
+        """Start MIDI input; note_on/note_off receive (note, velocity) directly, otherwise callback(event_type, note, velocity)"""
+        if callback is None and (note_on is None or note_off is None):
+            raise ValueError("MIDIHandler.start() needs a callback or both note_on and note_off")
         try:
-            available_devices = mido.get_input_names()
+            available_devices = get_input_names()
             DEBUG.log(f"Available MIDI devices: {available_devices}")
             
             # Auto-select first available device if none specified
@@ -66,21 +119,16 @@ class MIDIHandler:
                 self.device_name = available_devices[0]
                 DEBUG.log(f"Using first available device: {self.device_name}")
                 
-            self.input_port = mido.open_input(self.device_name)
             self.callback = callback
+            self._note_on = note_on or partial(callback, 'note_on')
+            self._note_off = note_off or partial(callback, 'note_off')
             
-            # Start message polling thread
-            def poll_messages():
-                while self.input_port:
-                    for msg in self.input_port.iter_pending():
-                        self._midi_callback(msg)
-                    time.sleep(0.001)  # Small sleep to prevent CPU hogging
-                    
-            self._poll_thread = Thread(target=poll_messages, daemon=True)
-            self._poll_thread.start()
+            # The backend calls _midi_callback from its own input thread as
+            # each message arrives, so no reader thread is needed here
+            self.input_port = mido.open_input(self.device_name, callback=self._midi_callback)
             
             DEBUG.log(f"MIDI input started successfully on {self.device_name}")
-            self._last_event_time = time.time()
+            self._last_event_time = time.monotonic_ns()
             
         except Exception as e:
             DEBUG.log(f"MIDI start error: {str(e)}")
@@ -95,7 +143,7 @@ class MIDIHandler:
         """Check periodically if we've received any input."""
         while True:
             time.sleep(2.0)  # Check every 2 seconds
-            elapsed = time.time() - self._last_event_time
+            elapsed = (time.monotonic_ns() - self._last_event_time) / 1e9
             if elapsed > 2.0:
                 print("No MIDI events detected in the last 2 seconds...")
             if not self.input_port:
@@ -103,15 +151,18 @@ class MIDIHandler:
 
     def _midi_callback(self, message):
         """Internal MIDI callback to process MIDI messages"""
-        self._last_event_time = time.time()
-        DEBUG.log(f"MIDI message received: {message}")
-        if message.type == 'note_on':
-            DEBUG.log(f"Note On: {message.note}, Velocity: {message.velocity}")
-            print(f"Note On: {message.note}, Velocity: {message.velocity}")  # Print individual keystrokes
-            self.callback('note_on', message.note, message.velocity)
-        elif message.type == 'note_off':
-            DEBUG.log(f"Note Off: {message.note}, Velocity: {message.velocity}")
-            print(f"Note Off: {message.note}, Velocity: {message.velocity}")  # Print individual keystrokes
-            self.callback('note_off', message.note, message.velocity)
-        else:
-            DEBUG.log(f"Unhandled MIDI message type: {message.type}")
+        if message.type in IGNORED_MESSAGE_TYPES:
+            return
+        self._last_event_time = time.monotonic_ns()  # Arrival time; immune to wall-clock steps
+        if DEBUG.verbose_midi:
+            DEBUG.log(f"MIDI message received: {message}")
+        try:
+            if message.type == 'note_on':
+                self._note_on(message.note, message.velocity)
+            elif message.type == 'note_off':
+                self._note_off(message.note, message.velocity)
+            elif message.type == 'control_change':
+                self._handle_cc(message.control, message.value)
+        except Exception as e:
+            # Runs on the backend's input thread; a failing handler must not stop input
+            DEBUG.log(f"MIDI handler error: {e}")
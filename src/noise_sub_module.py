@@ -5,6 +5,10 @@ Generates sub-oscillator signals and mixes them with the main oscillator signal.
 """
 
 import numpy as np
+from config import AUDIO_CONFIG
+
+# Partials in multiples of frequency / 2: the sub-oscillator itself (1) and its harmonics (2-8)
+PARTIALS = np.arange(1, 9, dtype=np.float64)
 
 class NoiseSubModule:
     """Generates sub-oscillator signals and mixes them with the main oscillator signal"""
@@ -14,6 +18,16 @@ class NoiseSubModule:
         self.sub_amount = 0.0
         self.harmonics = 0.0
         self.inharmonicity = 0.0
+        # Each partial is a complex phasor: a per-block rotation table, rebuilt only when
+        # frequency, inharmonicity or block size change, and a running start phase that
+        # keeps the partials continuous across blocks
+        self._rot_key = None
+        self._rot = np.zeros((len(PARTIALS), 0), dtype=np.complex64)
+        self._advance = np.ones(len(PARTIALS), dtype=np.complex64)  # Rotation over one block
+        self._phasor = np.ones(len(PARTIALS), dtype=np.complex64)  # Start phase of the next block
+        self._out = np.zeros(0, dtype=np.complex64)
+        self._rng = np.random.default_rng()
+        self._noise = np.zeros(0, dtype=np.float32)  # Noise scratch buffer, filled in place each block
 
     def set_parameters(self, noise_amount, sub_amount, harmonics, inharmonicity):
         """Set parameters for noise and sub-oscillator generation"""
@@ -22,14 +36,62 @@ class NoiseSubModule:
         self.harmonics = harmonics
         self.inharmonicity = inharmonicity
 
+    def _omega(self, frequency):
+        """Radians per sample of each partial at the given frequency"""
+        stretch = np.full(len(PARTIALS), 1 + self.inharmonicity)
+        stretch[0] = 1.0  # Inharmonicity only detunes the harmonics
+        return PARTIALS * stretch * (np.pi / AUDIO_CONFIG.SAMPLE_RATE) * frequency
+
     def generate(self, signal, frequency, frames):
         """Generate noise and sub-oscillator signals and mix them with the main signal"""
-        noise = np.random.uniform(-1.0, 1.0, frames) * self.noise_amount
-        sub_osc = np.sin(2 * np.pi * (frequency / 2) * np.arange(frames) / 44100) * self.sub_amount
+        if np.ndim(frequency):
+            return self._generate_swept(signal, np.asarray(frequency, dtype=np.float64), frames)
+        
+        key = (frequency, self.inharmonicity, frames)
+        if key != self._rot_key:
+            w = self._omega(frequency)
+            # Angles are computed in float64, then stored single precision for the per-block work
+            self._rot = np.exp(1j * np.outer(w, np.arange(frames))).astype(np.complex64)
+            self._advance = np.exp(1j * w * frames).astype(np.complex64)
+            if len(self._out) != frames:
+                self._out = np.empty(frames, dtype=np.complex64)
+            self._rot_key = key
+        
+        # Sub-oscillator plus harmonics/i weighted harmonics, summed in one product
+        weights = (self.harmonics / PARTIALS).astype(np.float32)
+        weights[0] = self.sub_amount
+        np.dot(weights * self._phasor, self._rot, out=self._out)
+        sub_osc = self._out.imag
         
-        # Add harmonics to the sub-oscillator
-        for i in range(2, 9):
-            harmonic_freq = frequency / 2 * i * (1 + self.inharmonicity)
-            sub_osc += np.sin(2 * np.pi * harmonic_freq * np.arange(frames) / 44100) * (self.harmonics / i)
+        # Advance the start phases; renormalize so rounding cannot change the amplitude
+        self._phasor *= self._advance
+        self._phasor /= np.abs(self._phasor)
         
-        return signal + noise + sub_osc
+        return self._mix(signal, sub_osc, frames)
+
+    def _generate_swept(self, signal, frequency, frames):
+        """Per-sample frequency (e.g. pitch LFO): integrate each partial's phase sample by sample"""
+        w = np.outer(self._omega(1.0), frequency[:frames])  # Radians per sample, (partials, frames)
+        phase = np.cumsum(w, axis=1)
+        phase -= w  # Sample n sits at the phase accumulated before it
+        phase += np.angle(self._phasor)[:, None]
+        weights = self.harmonics / PARTIALS
+        weights[0] = self.sub_amount
+        sub_osc = np.dot(weights, np.sin(phase)).astype(np.float32)
+        
+        # Carry the end phase into the next block
+        self._phasor = np.exp(1j * (phase[:, -1] + w[:, -1])).astype(np.complex64)
+        return self._mix(signal, sub_osc, frames)
+
+    def _mix(self, signal, sub_osc, frames):
+        """Add the sub-oscillator and, if enabled, uniform noise to the main signal"""
+        output = signal + sub_osc
+        if self.noise_amount:
+            if len(self._noise) != frames:
+                self._noise = np.empty(frames, dtype=np.float32)
+            # Uniform noise in [-amount, amount) drawn straight into the scratch buffer
+            noise = self._rng.random(dtype=np.float32, out=self._noise)
+            noise *= 2 * self.noise_amount
+            noise -= self.noise_amount
+            output += noise
+        return output
@@ -0,0 +1,47 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from debug import DebugSystem, SignalMonitor
+
+
+def test_get_data_before_any_write_is_silence():
+    monitor = SignalMonitor(buffer_size=64)
+    assert np.array_equal(monitor.get_data(), np.zeros(64, dtype=np.float32))
+
+
+def test_get_data_returns_latest_window_in_order_across_wraparound():
+    monitor = SignalMonitor(buffer_size=64)
+    samples = np.arange(1000, dtype=np.float32)
+    for start in range(0, len(samples), 48):  # Block size not dividing the ring, so writes straddle the end
+        monitor.update(samples[start:start + 48])
+    assert np.array_equal(monitor.get_data(), samples[-64:])
+
+
+def test_get_data_before_window_fills():
+    monitor = SignalMonitor(buffer_size=64)
+    monitor.update(np.arange(10, dtype=np.float32))
+    assert np.array_equal(monitor.get_data(), np.arange(10, dtype=np.float32))
+
+
+def test_signal_version_bumps_on_each_write():
+    debug = DebugSystem()
+    before = debug.get_signal_version('audio_out')
+    debug.monitor_signal('audio_out', np.ones(32, dtype=np.float32))
+    after = debug.get_signal_version('audio_out')
+    assert after != before
+    debug.monitor_signal('audio_out', np.ones(32, dtype=np.float32))
+    assert debug.get_signal_version('audio_out') != after
+    assert debug.get_signal_version('missing') == 0
+
+
+def test_clear_zeroes_ring_and_resets_write_index():
+    monitor = SignalMonitor(buffer_size=64)
+    monitor.update(np.ones(100, dtype=np.float32))
+    monitor.clear()
+    assert monitor.write_index == 0
+    assert not monitor.buffer.any()
+    assert np.array_equal(monitor.get_data(), np.zeros(64, dtype=np.float32))
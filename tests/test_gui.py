@@ -1,81 +1,128 @@
+import sys
+
+# Manual GUI prototype: under pytest, skip it (or its collection when Kivy is missing)
+if "pytest" in sys.modules:
+    import pytest
+    pytest.importorskip("kivy")
+    pytestmark = pytest.mark.skip(reason="GUI smoke test, run manually")
+
+import numpy as np
 from kivy.app import App
-from kivy.uix.gridlayout import GridLayout
-from kivy.uix.slider import Slider
-from kivy.uix.label import Label
-from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.togglebutton import ToggleButton
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+# Shared widget kwargs; tuples are immutable, so every widget can reuse them
+_SH_TITLE = (1, 0.1)
+_SH_LABEL = (1, 0.2)
+_SH_SLIDER = (1, 0.8)
+_SH_TOGGLE = (1, 0.2)
+_VBOX_KW = {"orientation": "vertical", "size_hint": (1, 1)}
+
+# Section contents, as module constants so build() iterates fixed tuples
+_ADSR = ("Attack", "Decay", "Sustain", "Release")
+_OSCS = ("Sin", "Saw", "Tri", "Pulse")
+_FILT = ("HP", "LP", "Bypass")
+_FX = ("Clipper", "Bypass")
+
+# Single-knob sections: (label, min, max, initial value)
+_FILTER_KNOBS = (("P Cutoff", 0, 100, 50), ("Reson", 0, 100, 8))
+_NOISE_KNOBS = (("Noise Level", 0, 100, 0),)
+
+# ToggleButton group keys, shared by every button in the group
+_GRP_FILTER = sys.intern("filter")
+_GRP_FX = sys.intern("fx")
+
+
+
+def _import_widgets():
+    """Import the widget classes on first build, so importing this file loads only App, Clock and Logger"""
+    global BoxLayout, GridLayout, Label, Slider, ToggleButton
+    from kivy.uix.boxlayout import BoxLayout
+    from kivy.uix.gridlayout import GridLayout
+    from kivy.uix.label import Label
+    from kivy.uix.slider import Slider
+    from kivy.uix.togglebutton import ToggleButton
 
 
 class SynthInterfaceApp(App):
     def build(self):
+        _import_widgets()
+
+        # Slider changes are collected here and flushed once per frame
+        self._pending = {}
+        self._flush_trigger = Clock.create_trigger(self._flush_slider_changes, 0)
+        self._flush_count = 0
+        self._slider_idx = {}  # Slider -> index into self.params
+        self._initial_values = []
+
         # Main Layout
-        main_layout = GridLayout(cols=3, padding=10, spacing=10)
+        main_layout = GridLayout(cols=3, rows=6, padding=10, spacing=10)  # 18 children, sized up front
 
         # ADSR Section
-        main_layout.add_widget(Label(text="ADSR", bold=True, size_hint=(1, 0.1)))
-        for label in ["Attack", "Decay", "Sustain", "Release"]:
-            knob_layout = BoxLayout(orientation="vertical", size_hint=(1, 1))
-            knob_layout.add_widget(Label(text=label, size_hint=(1, 0.2)))
-            slider = Slider(min=0, max=100, value=50, size_hint=(1, 0.8))
-            slider.bind(value=self.on_slider_change)
-            knob_layout.add_widget(slider)
-            main_layout.add_widget(knob_layout)
+        main_layout.add_widget(Label(text="ADSR", bold=True, size_hint=_SH_TITLE))
+        for label in _ADSR:
+            main_layout.add_widget(self._make_knob(label, 0, 100, 50))
 
         # Oscillator Section
-        main_layout.add_widget(Label(text="Oscillators", bold=True, size_hint=(1, 0.1)))
-        for osc in ["Sin", "Saw", "Tri", "Pulse"]:
-            knob_layout = BoxLayout(orientation="vertical", size_hint=(1, 1))
-            knob_layout.add_widget(Label(text=osc, size_hint=(1, 0.2)))
-            slider = Slider(min=-60, max=60, value=0, size_hint=(1, 0.8))
-            slider.bind(value=self.on_slider_change)
-            knob_layout.add_widget(slider)
-            main_layout.add_widget(knob_layout)
+        main_layout.add_widget(Label(text="Oscillators", bold=True, size_hint=_SH_TITLE))
+        for osc in _OSCS:
+            main_layout.add_widget(self._make_knob(osc, -60, 60, 0))
 
         # Filter Section
-        main_layout.add_widget(Label(text="Filter", bold=True, size_hint=(1, 0.1)))
-        knob_layout = BoxLayout(orientation="vertical", size_hint=(1, 1))
-        knob_layout.add_widget(Label(text="P Cutoff", size_hint=(1, 0.2)))
-        cutoff_slider = Slider(min=0, max=100, value=50, size_hint=(1, 0.8))
-        cutoff_slider.bind(value=self.on_slider_change)
-        knob_layout.add_widget(cutoff_slider)
-        main_layout.add_widget(knob_layout)
-
-        knob_layout = BoxLayout(orientation="vertical", size_hint=(1, 1))
-        knob_layout.add_widget(Label(text="Reson", size_hint=(1, 0.2)))
-        reson_slider = Slider(min=0, max=100, value=8, size_hint=(1, 0.8))
-        reson_slider.bind(value=self.on_slider_change)
-        knob_layout.add_widget(reson_slider)
-        main_layout.add_widget(knob_layout)
+        main_layout.add_widget(Label(text="Filter", bold=True, size_hint=_SH_TITLE))
+        for knob in _FILTER_KNOBS:
+            main_layout.add_widget(self._make_knob(*knob))
 
         # Filter Switches
-        switch_layout = BoxLayout(orientation="vertical", size_hint=(1, 1))
-        switch_layout.add_widget(Label(text="Filter Type", size_hint=(1, 0.2)))
-        for mode in ["HP", "LP", "Bypass"]:
-            toggle = ToggleButton(text=mode, size_hint=(1, 0.2), group="filter")
+        switch_layout = BoxLayout(**_VBOX_KW)
+        switch_layout.add_widget(Label(text="Filter Type", size_hint=_SH_LABEL))
+        for mode in _FILT:
+            toggle = ToggleButton(text=mode, size_hint=_SH_TOGGLE, group=_GRP_FILTER)
             switch_layout.add_widget(toggle)
         main_layout.add_widget(switch_layout)
 
         # Noise Section
-        main_layout.add_widget(Label(text="Noise", bold=True, size_hint=(1, 0.1)))
-        noise_layout = BoxLayout(orientation="vertical", size_hint=(1, 1))
-        noise_layout.add_widget(Label(text="Noise Level", size_hint=(1, 0.2)))
-        noise_slider = Slider(min=0, max=100, value=0, size_hint=(1, 0.8))
-        noise_slider.bind(value=self.on_slider_change)
-        noise_layout.add_widget(noise_slider)
-        main_layout.add_widget(noise_layout)
+        main_layout.add_widget(Label(text="Noise", bold=True, size_hint=_SH_TITLE))
+        for knob in _NOISE_KNOBS:
+            main_layout.add_widget(self._make_knob(*knob))
 
         # FX Section
-        main_layout.add_widget(Label(text="FX", bold=True, size_hint=(1, 0.1)))
-        fx_layout = BoxLayout(orientation="vertical", size_hint=(1, 1))
-        for fx in ["Clipper", "Bypass"]:
-            toggle = ToggleButton(text=fx, size_hint=(1, 0.2), group="fx")
+        main_layout.add_widget(Label(text="FX", bold=True, size_hint=_SH_TITLE))
+        fx_layout = BoxLayout(**_VBOX_KW)
+        for fx in _FX:
+            toggle = ToggleButton(text=fx, size_hint=_SH_TOGGLE, group=_GRP_FX)
             fx_layout.add_widget(toggle)
         main_layout.add_widget(fx_layout)
 
+        # Current value of every slider in one contiguous buffer, in creation order
+        self.params = np.array(self._initial_values, dtype=np.float32)
         return main_layout
 
+    def _make_knob(self, text, lo, hi, value):
+        """Build a labelled slider wired to on_slider_change"""
+        knob_layout = BoxLayout(**_VBOX_KW)
+        knob_layout.add_widget(Label(text=text, size_hint=_SH_LABEL))
+        slider = Slider(min=lo, max=hi, value=value, size_hint=_SH_SLIDER)
+        slider.fbind('value', self.on_slider_change)
+        self._slider_idx[slider] = len(self._initial_values)
+        self._initial_values.append(value)
+        knob_layout.add_widget(slider)
+        return knob_layout
+
     def on_slider_change(self, instance, value):
-        print(f"{instance} changed to {value}")
+        self._pending[instance] = value
+        self._flush_trigger()
+
+    def _flush_slider_changes(self, dt):
+        """Handle the latest value of each slider moved since the last frame"""
+        pending, self._pending = self._pending, {}
+        for instance, value in pending.items():
+            self.params[self._slider_idx[instance]] = value
+        self._flush_count += 1
+        if self._flush_count % 10:
+            return  # Only every 10th flush is logged, so a drag does not flood the log
+        for instance, value in pending.items():
+            Logger.debug("Synth: %s changed to %s", instance, value)
 
     def _show_error(self, message):
         """Show an error message in a popup window"""
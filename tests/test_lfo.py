@@ -0,0 +1,33 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config import AUDIO_CONFIG
+from lfo import LFO, TABLE_SIZE
+
+FRAMES = 256
+
+
+def test_generate_into_out_is_continuous_across_blocks():
+    lfo = LFO(frequency=3.0, waveform='sine')
+    out = np.empty(FRAMES, dtype=np.float32)
+    blocks = []
+    for _ in range(50):
+        values = lfo.generate(FRAMES, out=out)
+        assert np.shares_memory(values, out)  # Written in place, no new allocation
+        blocks.append(values.copy())
+        lfo.process()  # The audio callback steps once more after each block
+    n = np.arange(50 * FRAMES)
+    expected = np.sin(2 * np.pi * 3.0 * n / AUDIO_CONFIG.SAMPLE_RATE)
+    # Table lookup truncates the phase to TABLE_SIZE steps
+    assert np.max(np.abs(np.concatenate(blocks) - expected)) < 2 * np.pi / TABLE_SIZE
+
+
+def test_block_plus_process_advances_phase_by_block_length():
+    lfo = LFO(frequency=1.0)
+    lfo.generate(1024)
+    lfo.process()
+    assert abs(lfo.phase - 1024 / AUDIO_CONFIG.SAMPLE_RATE) < 1e-12
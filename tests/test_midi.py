@@ -0,0 +1,41 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("mido")
+pytest.importorskip("sounddevice")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config import MIDI_CONFIG, PARAM_INDEX, STATE
+from midi import MIDIHandler
+
+
+@pytest.fixture
+def params():
+    saved = STATE.params.copy()
+    yield STATE.params
+    STATE.params[:] = saved
+
+
+def test_apply_pending_coalesces_to_latest_value(params):
+    handler = MIDIHandler()
+    cutoff = MIDI_CONFIG.FILTER_CUTOFF_CC
+    for value in (10, 40, 100):
+        handler._handle_cc(cutoff, value)
+    handler._handle_cc(MIDI_CONFIG.FILTER_RES_CC, 127)
+    assert len(handler._pending) == 2  # One entry per CC, whatever the message count
+    handler.apply_pending()
+    assert not handler._pending
+    assert params[PARAM_INDEX['filter_cutoff']] == pytest.approx(100 / 127)
+    assert params[PARAM_INDEX['filter_res']] == pytest.approx(1.0)
+
+
+def test_repeated_and_unmapped_ccs_are_not_queued(params):
+    handler = MIDIHandler()
+    handler._handle_cc(MIDI_CONFIG.FILTER_CUTOFF_CC, 64)
+    handler.apply_pending()
+    handler._handle_cc(MIDI_CONFIG.FILTER_CUTOFF_CC, 64)
+    handler._handle_cc(120, 5)  # Not in the CC map
+    assert not handler._pending
@@ -0,0 +1,51 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config import AUDIO_CONFIG
+from noise_sub_module import NoiseSubModule
+
+FREQ = 440.0
+FRAMES = 256
+
+
+def _closed_form(frequency, n, sub_amount, harmonics, inharmonicity):
+    """Sub-oscillator plus harmonics as a sum of sines at sample indices n"""
+    t = n / AUDIO_CONFIG.SAMPLE_RATE
+    out = np.sin(2 * np.pi * (frequency / 2) * t) * sub_amount
+    for i in range(2, 9):
+        out += np.sin(2 * np.pi * frequency / 2 * i * (1 + inharmonicity) * t) * (harmonics / i)
+    return out
+
+
+def _module(inharmonicity=0.0):
+    module = NoiseSubModule()
+    module.set_parameters(0.0, 0.5, 0.3, inharmonicity)
+    return module
+
+
+def test_first_block_matches_closed_form():
+    module = _module(inharmonicity=0.01)
+    out = module.generate(np.zeros(FRAMES, dtype=np.float32), FREQ, FRAMES)
+    expected = _closed_form(FREQ, np.arange(FRAMES), 0.5, 0.3, 0.01)
+    assert np.max(np.abs(out - expected)) < 1e-6
+
+
+def test_phase_stays_continuous_across_blocks():
+    module = _module()
+    blocks = 200
+    out = np.concatenate([module.generate(np.zeros(FRAMES, dtype=np.float32), FREQ, FRAMES)
+                          for _ in range(blocks)])
+    expected = _closed_form(FREQ, np.arange(blocks * FRAMES), 0.5, 0.3, 0.0)
+    assert np.max(np.abs(out - expected)) < 1e-5
+
+
+def test_per_sample_frequency_matches_scalar():
+    swept, fixed = _module(), _module()
+    for _ in range(4):
+        signal = np.zeros(FRAMES, dtype=np.float32)
+        out = swept.generate(signal, np.full(FRAMES, FREQ), FRAMES)
+        assert np.max(np.abs(out - fixed.generate(signal, FREQ, FRAMES))) < 1e-4